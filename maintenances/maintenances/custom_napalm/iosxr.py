@@ -1,4 +1,3 @@
-import copy
 import re
 import tempfile
 
@@ -10,6 +9,34 @@ from netaddr import EUI
 
 from . import textfsm_bgp_rx, textfsm_nd, textfsm_optics
 
+# flat defaults of immutable values, shallow copies are sufficient
+_MPLS_DEFAULTS = {
+    "mpls_enabled": False,
+}
+
+_ISIS_DEFAULTS = {
+    "isis_neighbor": "",
+    "isis_state": False,
+    "isis_nh": "",
+    "isis_ipv6": False,
+    "isis_metric": 0,
+}
+
+_ARP_DEFAULTS = {
+    "arp_nh": "",
+    "arp_nh_mac": "",
+}
+
+_ND_DEFAULTS = {
+    "nd_nh": "",
+    "nd_mac": "",
+}
+
+_OPTICS_DEFAULTS = {
+    "optic": "",
+    "optic_serial": "",
+}
+
 
 class CustomIOSXRDriver(IOSXRDriver):
     """Extends base IOSXRDriver for custom methods"""
@@ -41,9 +68,6 @@ class CustomIOSXRDriver(IOSXRDriver):
     def get_mpls_interfaces_custom(self):
         """Returns dict of MPLS enabled intefaces."""
         mpls_interfaces = {}
-        MPLS_DEFAULTS = {
-            "mpls_enabled": False,
-        }
 
         mpls_rpc_request = "<Get><Operational><MPLS_LSD><InterfaceTable>\
         </InterfaceTable></MPLS_LSD></Operational></Get>"
@@ -53,7 +77,7 @@ class CustomIOSXRDriver(IOSXRDriver):
         for mpls_interface in mpls_rpc_reply.xpath(".//InterfaceTable/Interface"):
             interface = napalm_find_txt(mpls_interface, "Naming/InterfaceName")
 
-            mpls_interfaces[interface] = copy.deepcopy(MPLS_DEFAULTS)
+            mpls_interfaces[interface] = _MPLS_DEFAULTS.copy()
             mpls_interfaces[interface].update(
                 {
                     "mpls_enabled": True,
@@ -68,13 +92,6 @@ class CustomIOSXRDriver(IOSXRDriver):
         """
 
         isis_neighbors = {}
-        ISIS_DEFAULTS = {
-            "isis_neighbor": "",
-            "isis_state": False,
-            "isis_nh": "",
-            "isis_ipv6": False,
-            "isis_metric": 0,
-        }
 
         isis_rpc_request = "<Get><Operational><ISIS><InstanceTable><Instance><Naming>\
         <InstanceName>2152</InstanceName></Naming><HostnameTable></HostnameTable>\
@@ -104,7 +121,7 @@ class CustomIOSXRDriver(IOSXRDriver):
                 if host_systemID == systemID:
                     host = napalm_find_txt(hostname, "HostName")
 
-            isis_neighbors[interface] = copy.deepcopy(ISIS_DEFAULTS)
+            isis_neighbors[interface] = _ISIS_DEFAULTS.copy()
             isis_neighbors[interface].update(
                 {
                     "isis_neighbor": host,
@@ -144,10 +161,6 @@ class CustomIOSXRDriver(IOSXRDriver):
         rpc_reply = ETREE.fromstring(self.device.make_rpc_call(rpc_request))
 
         arp_table = {}
-        ARP_DEFAULTS = {
-            "arp_nh": "",
-            "arp_nh_mac": "",
-        }
 
         for entry in rpc_reply.xpath(".//EntryTable/Entry"):
             if napalm_find_txt(entry, "State") == "StateDynamic":
@@ -159,7 +172,7 @@ class CustomIOSXRDriver(IOSXRDriver):
                     "-", ":"
                 )
 
-            arp_table[interface] = copy.deepcopy(ARP_DEFAULTS)
+            arp_table[interface] = _ARP_DEFAULTS.copy()
             arp_table[interface].update(
                 {
                     "arp_nh": next_hop,
@@ -190,7 +203,7 @@ class CustomIOSXRDriver(IOSXRDriver):
                     port = "Bundle-Ether"
                 port = port + short_port[2:]
 
-                self.nd_table[port] = copy.deepcopy(self.ND_DEFAULTS)
+                self.nd_table[port] = _ND_DEFAULTS.copy()
                 self.nd_table[port].update(
                     {
                         "nd_nh": neighbor[0],
@@ -199,10 +212,6 @@ class CustomIOSXRDriver(IOSXRDriver):
                 )
 
         self.nd_table = {}
-        self.ND_DEFAULTS = {
-            "nd_nh": "",
-            "nd_mac": "",
-        }
 
         command = 'show ipv6 neighbors | ex "fe80|Mcast"'
         output = self.cli([command])[command]
@@ -228,10 +237,6 @@ class CustomIOSXRDriver(IOSXRDriver):
         """
 
         optics = {}
-        OPTICS_DEFAULTS = {
-            "optic": "",
-            "optic_serial": "",
-        }
 
         command = r'show inventory | util egrep -A1 "[0-9]{1,3}\/[0-9]{1}\/(([0-9]{1})|(CPU)[0-9]{1})\/[0-9]{1,2}"'
         output = self.cli([command])[command]
@@ -248,7 +253,7 @@ class CustomIOSXRDriver(IOSXRDriver):
                 continue
 
             port = re.sub("(CPU)|(module mau)", "", optic_list[0]).strip()
-            optics[port] = copy.deepcopy(OPTICS_DEFAULTS)
+            optics[port] = _OPTICS_DEFAULTS.copy()
             optics[port].update(
                 {
                     "optic": optic_list[1],
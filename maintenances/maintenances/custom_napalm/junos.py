@@ -1,4 +1,6 @@
 import logging
+from functools import lru_cache
+from typing import Iterable, Optional
 
 import netaddr
 from jnpr.junos.exception import RpcError
@@ -9,11 +11,31 @@ from custom_napalm.utils import junos_cust_views
 log = logging.getLogger(__file__)
 
 
+@lru_cache(maxsize=4096)
+def _fmt_mac(raw: str) -> Optional[str]:
+    """Normalize MAC to colon-separated EUI format, None if not a valid MAC."""
+    try:
+        return str(netaddr.EUI(raw)).replace("-", ":")
+    except netaddr.core.AddrFormatError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _route_table(route: str) -> str:
+    """Return the unicast routing table for the destination's address family."""
+    return "inet.0" if netaddr.IPNetwork(route).version == 4 else "inet6.0"
+
+
 class CustomJunOSDriver(JunOSDriver):
     """Extends base JunOSDriver for custom methods."""
 
     def _rpc_get(self, rpc_input, msg):
-        """Method for rpc get, return errors."""
+        """Method for rpc get, return errors.
+
+        Tables are created per call by each getter rather than cached on the
+        driver. The views are already built once at import by FactoryLoader, and
+        a cached table would keep its last reply XML alive.
+        """
         try:
             return rpc_input.get()
         except RpcError as rpcerr:
@@ -21,15 +43,26 @@ class CustomJunOSDriver(JunOSDriver):
             log.error(str(rpcerr))
             return {}
 
-    def _bgp_routes_format(self, route_dict: dict, destination: str) -> dict:
-        """Takes dict created from returned tuple, and parses."""
+    def _rpc_items(self, rpc_input, msg):
+        """Lazily yield (key, fields) per table entry, pairing keys with views
+        as PyEZ Table 'items()' does, without building the fields list first.
+        Entries without a key element are handled the same as by 'items()'.
+        """
+        table = self._rpc_get(rpc_input, msg)
+        for key, view in zip(table.keys(), table):
+            yield key, view.items()
+
+    def _bgp_routes_format(self, route_dict: dict, destination: str) -> tuple:
+        """Takes dict created from returned tuple, and parses.
+        Returns (prefix, route attributes) pair.
+        """
         prefix_length = route_dict.pop("prefix_length", 32)
         destination = f"{destination}/{prefix_length}"
 
         as_path = route_dict.get("as_path")
         if as_path is not None:  # return only AS Numbers
             as_path = (
-                as_path.split(" I ")[0]
+                as_path.split(" I ", 1)[0]
                 .replace("AS path:", "")
                 .replace("I", "")
                 .replace("\n Recorded", "")
@@ -40,14 +73,12 @@ class CustomJunOSDriver(JunOSDriver):
         if communities is not None and type(communities) is not list:
             communities = [communities]
 
-        return {
-            destination: {
-                "Next-Hop": route_dict["next_hop"],
-                "Local Preference": route_dict["local_preference"],
-                "AS-Path": as_path,
-                "MED": route_dict["metric"],
-                "Communities": communities,
-            }
+        return destination, {
+            "Next-Hop": route_dict["next_hop"],
+            "Local Preference": route_dict["local_preference"],
+            "AS-Path": as_path,
+            "MED": route_dict["metric"],
+            "Communities": communities,
         }
 
     def get_isis_interfaces_custom(self) -> dict:
@@ -76,27 +107,27 @@ class CustomJunOSDriver(JunOSDriver):
         }
         """
         rpc_adj = junos_cust_views.ISISAdjacencyTable(self.device)
-        isis_adjacencies = self._rpc_get(rpc_adj, "IS-IS neighbors").items()
+        isis_adjacencies = self._rpc_items(rpc_adj, "IS-IS neighbors")
         rpc_int = junos_cust_views.ISISInterfaceTable(self.device)
-        isis_interfaces = self._rpc_get(rpc_int, "IS-IS neighbors").items()
+        isis_interfaces = self._rpc_items(rpc_int, "IS-IS neighbors")
 
         # convert int_results to dict
         int_dict = {}
-        for interface in isis_interfaces:
-            int_dict.update({interface[0]: {elem[0]: elem[1] for elem in interface[1]}})
+        for interface, record in isis_interfaces:
+            int_dict[interface] = dict(record)
 
         # create return dict
         isis = {}
-        for neighbor in isis_adjacencies:
-            isis.update({neighbor[0]: {elem[0]: elem[1] for elem in neighbor[1]}})
-            isis[neighbor[0]].update(int_dict[neighbor[0]])
+        for interface, record in isis_adjacencies:
+            isis[interface] = dict(record)
+            isis[interface].update(int_dict[interface])
         return isis
 
     def get_mpls_interfaces_custom(self) -> dict:
         """Via PyEZ, return dict of MPLS-enabled interfaces.
 
         RPC output:
-        [((PORT,), [("mpls_enabled", bool)])]
+        [(PORT, [("mpls_enabled", bool)])]
 
         method return:
         {{ Interface }}: {
@@ -104,12 +135,12 @@ class CustomJunOSDriver(JunOSDriver):
         }
         """
         rpc = junos_cust_views.MPLSInterfaceTable(self.device)
-        mpls_interfaces = self._rpc_get(rpc, "MPLS Interfaces").items()
+        mpls_interfaces = self._rpc_items(rpc, "MPLS Interfaces")
 
         # create return dict
         mpls = {}
-        for port in mpls_interfaces:
-            mpls.update({port[0][0]: {elem[0]: elem[1] for elem in port[1]}})
+        for port, record in mpls_interfaces:
+            mpls[port] = dict(record)
         return mpls
 
     def get_msdp_neighbrs_custom(self) -> list:
@@ -137,17 +168,14 @@ class CustomJunOSDriver(JunOSDriver):
         MAC is normalized using EUI format.
         """
         rpc = junos_cust_views.ARPTable(self.device)
-        arp_table = self._rpc_get(rpc, "ARP").items()
+        arp_table = self._rpc_items(rpc, "ARP")
 
         arp = {}
-        for neighbor in arp_table:
-            arp.update({neighbor[0]: {elem[0]: elem[1] for elem in neighbor[1]}})
-            mac = arp[neighbor[0]]["arp_nh_mac"]
-
-            try:
-                arp[neighbor[0]]["arp_nh_mac"] = str(netaddr.EUI(mac)).replace("-", ":")
-            except netaddr.core.AddrFormatError:
-                pass
+        for interface, record in arp_table:
+            neighbor = dict(record)
+            mac = neighbor["arp_nh_mac"]
+            neighbor["arp_nh_mac"] = _fmt_mac(mac) or mac
+            arp[interface] = neighbor
         return arp
 
     def get_nd_table_custom(self) -> dict:
@@ -165,17 +193,14 @@ class CustomJunOSDriver(JunOSDriver):
         MAC is normalized using EUI format.
         """
         rpc = junos_cust_views.NDTable(self.device)
-        nd_table = self._rpc_get(rpc, "IPv6 ND").items()
+        nd_table = self._rpc_items(rpc, "IPv6 ND")
 
         nd = {}
-        for neighbor in nd_table:
-            nd.update({neighbor[0]: {elem[0]: elem[1] for elem in neighbor[1]}})
-            mac = nd[neighbor[0]]["nd_nh_mac"]
-
-            try:
-                nd[neighbor[0]]["nd_nh_mac"] = str(netaddr.EUI(mac)).replace("-", ":")
-            except netaddr.core.AddrFormatError:
-                pass
+        for interface, record in nd_table:
+            neighbor = dict(record)
+            mac = neighbor["nd_nh_mac"]
+            neighbor["nd_nh_mac"] = _fmt_mac(mac) or mac
+            nd[interface] = neighbor
         return nd
 
     def get_bgp_neighbors_detail_custom(self) -> dict:
@@ -227,18 +252,16 @@ class CustomJunOSDriver(JunOSDriver):
         },
         """
         rpc = junos_cust_views.junos_bgp_neighbors_table(self.device)
-        neighbor_data = self._rpc_get(rpc, "BGP Neighbors").items()
+        neighbor_data = self._rpc_items(rpc, "BGP Neighbors")
 
         bgp_detail = {}
         for neighbor in neighbor_data:
-            neighbor_details = {elem[0]: elem[1] for elem in neighbor[1]}
+            neighbor_details = dict(neighbor[1])
 
-            # remove one of local_as or local_as_2, etc
-            for i in ["local_as", "remote_as"]:
-                if not neighbor_details[i]:
-                    neighbor_details[i] = neighbor_details.pop(f"{i}_2")
-                else:
-                    neighbor_details.pop(f"{i}_2")
+            # fold local_as_2/remote_as_2 (under 'bgp-peer-header') into local_as, etc
+            for i in ("local_as", "remote_as"):
+                fallback = neighbor_details.pop(f"{i}_2", None)
+                neighbor_details[i] = neighbor_details.get(i) or fallback or 0
 
             # remove ports from address field if present
             neighbor_details["local_address"] = neighbor_details["local_address"].split(
@@ -253,9 +276,9 @@ class CustomJunOSDriver(JunOSDriver):
             neighbors_rib = neighbor_details.pop("rib").items()
             for rib_table in neighbors_rib:
                 if rib_table[0] in _RIB_TABLES:  # prune non-unicast ribs
-                    neighbor_details.update({rib_table[0]: dict(rib_table[1])})
+                    neighbor_details[rib_table[0]] = dict(rib_table[1])
 
-            bgp_detail.update({neighbor[0].split("+")[0]: neighbor_details})
+            bgp_detail[neighbor[0].split("+")[0]] = neighbor_details
         return bgp_detail
 
     def get_bgp_neighbor_routes_custom(self, peer: str) -> list:
@@ -295,18 +318,18 @@ class CustomJunOSDriver(JunOSDriver):
             log.error(str(rpcerr))
             routes_table = {}
 
-        for route in routes_table.items():
-            route_dict = {elem[0]: elem[1] for elem in route[1]}
-            routes.update(self._bgp_routes_format(route_dict, route[0]))
+        for destination, record in routes_table.items():
+            prefix, route = self._bgp_routes_format(dict(record), destination)
+            routes[prefix] = route
 
         return routes
 
-    def get_route_to_custom(self, routes_list: list, neighbor="") -> dict:
+    def get_route_to_custom(self, routes_list: Iterable, neighbor="") -> dict:
         """Custom implementation of default 'get_route_to' getter. Returns less info,
         specific to BGP. Eliminates the need for a parser. Much of this is from the
         Napalm getter.
 
-        Accepts a list of destinations, returns a nested dict of results.
+        Accepts an iterable of destinations, returns a nested dict of results.
 
 
         method return:
@@ -320,27 +343,32 @@ class CustomJunOSDriver(JunOSDriver):
             }
         }
         """
-        if not isinstance(routes_list, list):
-            raise TypeError("Please a valid list of destinations")
-
         routes = {}
         routes_table = junos_cust_views.junos_bgp_route_table(self.device)
 
+        # group destinations by address family, parsing each only once
+        routes_by_table = {"inet.0": [], "inet6.0": []}
         for route in routes_list:
             if route:
-                table_key = "" if netaddr.IPNetwork(route).version == 4 else "6"
+                routes_by_table[_route_table(route)].append(route)
+
+        for table, destinations in routes_by_table.items():
+            for route in destinations:
+                # only the first (active) record is needed
                 try:
-                    route_output = routes_table.get(
-                        route, table=f"inet{table_key}.0"
-                    ).items()
+                    route_output = next(iter(routes_table.get(route, table=table)))
                 except RpcError as rpcerr:
                     log.error("Unable to retrieve BGP Rx Routes information:")
                     log.error(str(rpcerr))
-                    routes_table = {}
+                    continue
+                except StopIteration:
+                    log.error(f"No route returned for {route} in {table}")
+                    continue
 
-                route_dict = {elem[0]: elem[1] for elem in route_output[0][1]}
+                route_dict = dict(route_output.items())
                 destination = route_dict.pop("destination", "")
-                routes.update(self._bgp_routes_format(route_dict, destination))
+                prefix, route_attrs = self._bgp_routes_format(route_dict, destination)
+                routes[prefix] = route_attrs
 
         if not routes:
             routes = "No active BGP prefixes."
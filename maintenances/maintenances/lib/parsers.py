@@ -1,8 +1,21 @@
 import socket
+from functools import lru_cache
+from typing import Optional
 
 import netaddr
 
 
+@lru_cache(maxsize=1024)
+def dns_name(ipaddress: str) -> Optional[str]:
+    """Return short hostname from PTR record, None if not present.
+    Cached, as addresses repeat across peers and circuits.
+    """
+    try:
+        return socket.gethostbyaddr(ipaddress)[0].split(".")[0]
+    except (socket.herror, socket.gaierror):
+        return None
+
+
 def format_ip_int(data: dict):
     """Collapse napalm ip_interface output to:
 
@@ -19,10 +32,9 @@ def format_ip_int(data: dict):
             ip = v.get(f"ipv{i}")
             if ip:
                 address = next(iter(ip))
-                ip_dict.update(
-                    {f"ipv{i}_address": f"{address}/{ip[address]['prefix_length']}"}
-                )
-        output.update({k: ip_dict})
+                prefix_length = ip[address]["prefix_length"]
+                ip_dict[f"ipv{i}_address"] = f"{address}/{prefix_length}"
+        output[k] = ip_dict
     return output
 
 
@@ -33,15 +45,13 @@ def collapse_bgp(iface_dict, bgp_dict):
     is matched with an interface, the BGP dict is popped, allowing the peerings
     not associated with an interface to be returned later.
     """
-    for iface in iface_dict:
+    for iface_data in iface_dict.values():
         v4_neighbor, v6_neighbor = None, None
 
         # iBGP
-        if iface_dict[iface].get("isis_neighbor"):
-            isis_neighbor = iface_dict[iface]["isis_neighbor"]
-
+        isis_neighbor = iface_data.get("isis_neighbor")
+        if isis_neighbor:
             # try finding A/AAAA records for the ISIS neighbor hostname
-            v6_neighbor = None
             try:
                 v4_neighbor = socket.gethostbyname(isis_neighbor)
             except socket.gaierror:
@@ -55,23 +65,17 @@ def collapse_bgp(iface_dict, bgp_dict):
                     pass
 
         # eBGP
-        elif iface_dict[iface].get("arp_nh"):
-            v4_neighbor = iface_dict[iface]["arp_nh"]
-            if iface_dict[iface].get("nd_nh"):
-                v6_neighbor = iface_dict[iface]["nd_nh"]
-
-        # update interface dict with BGP neighbor
-        if v4_neighbor and bgp_dict.get(v4_neighbor):
-            iface_dict[iface].update(bgp_dict[v4_neighbor])
-
-            # remove matched peer, un-matched will be dumped to a second sheet
-            bgp_dict.pop(v4_neighbor, None)
-
-        if v6_neighbor and bgp_dict.get(v6_neighbor):
-            iface_dict[iface].update(bgp_dict[v6_neighbor])
-
-            # remove matched peer, un-matched will be dumped to a second sheet
-            bgp_dict.pop(v6_neighbor, None)
+        elif iface_data.get("arp_nh"):
+            v4_neighbor = iface_data["arp_nh"]
+            v6_neighbor = iface_data.get("nd_nh") or None
+
+        # update interface dict with BGP neighbor, removing matched peers so
+        # un-matched can be dumped to a second sheet
+        for neighbor in (v4_neighbor, v6_neighbor):
+            if neighbor:
+                peer = bgp_dict.pop(neighbor, None)
+                if peer:
+                    iface_data.update(peer)
     return iface_dict, bgp_dict
 
 
@@ -91,79 +95,63 @@ def format_bgp_detail(data: dict):
             )
 
             dns = "No A/AAAA Record"
-            try:
-                local_dns = socket.gethostbyaddr(peer["local_address"])[0].split(".")[0]
-            except socket.herror:
-                local_dns = dns
-
-            try:
-                remote_dns = socket.gethostbyaddr(peer["remote_address"])[0].split(".")[
-                    0
-                ]
-            except socket.herror:
-                remote_dns = dns
-
-            bgp_output.update(
-                {
-                    peer["remote_address"]: {
-                        "is_up": peer["up"],
-                        "local_as": peer["local_as"],
-                        "remote_as": peer["remote_as"],
-                        "router_id": peer["router_id"],
-                        "local_address": peer["local_address"],
-                        "local_dns": local_dns,
-                        "remote_address": peer["remote_address"],
-                        "remote_dns": remote_dns,
-                        "import_policy": peer["import_policy"],
-                        "export_policy": peer["export_policy"],
-                        f"{ip_type}_received_prefix": peer["received_prefix_count"],
-                        f"{ip_type}_accepted_prefix": peer["accepted_prefix_count"],
-                        f"{ip_type}_advertised_prefix": peer["advertised_prefix_count"],
-                    }
-                }
-            )
+            local_dns = dns_name(peer["local_address"]) or dns
+            remote_dns = dns_name(peer["remote_address"]) or dns
+
+            bgp_output[peer["remote_address"]] = {
+                "is_up": peer["up"],
+                "local_as": peer["local_as"],
+                "remote_as": peer["remote_as"],
+                "router_id": peer["router_id"],
+                "local_address": peer["local_address"],
+                "local_dns": local_dns,
+                "remote_address": peer["remote_address"],
+                "remote_dns": remote_dns,
+                "import_policy": peer["import_policy"],
+                "export_policy": peer["export_policy"],
+                f"{ip_type}_received_prefix": peer["received_prefix_count"],
+                f"{ip_type}_accepted_prefix": peer["accepted_prefix_count"],
+                f"{ip_type}_advertised_prefix": peer["advertised_prefix_count"],
+            }
     return bgp_output
 
 
-def sort_df_circuits_columns(df):
-    df = df[
-        [
-            "interfaces",
-            "description",
-            "speed",
-            "mtu",
-            "is_enabled",
-            "is_up",
-            "optic",
-            "optic_serial",
-            "mac_address",
-            "ipv4_address",
-            "ipv6_address",
-            "isis_neighbor",
-            "isis_state",
-            "isis_nh",
-            "isis_metric",
-            "isis_ipv6",
-            "mpls_enabled",
-            "arp_nh",
-            "arp_nh_mac",
-            "nd_nh",
-            "nd_mac",
-            "local_as",
-            "remote_as",
-            "router_id",
-            "local_address",
-            "local_dns",
-            "remote_address",
-            "remote_dns",
-            "import_policy",
-            "export_policy",
-            "v4_received_prefix",
-            "v4_accepted_prefix",
-            "v4_advertised_prefix",
-            "v6_received_prefix",
-            "v6_accepted_prefix",
-            "v6_advertised_prefix",
-        ]
-    ]
-    return df
+# column order for circuits DataFrames pushed to GSheets
+CIRCUITS_COLUMNS = (
+    "interfaces",
+    "description",
+    "speed",
+    "mtu",
+    "is_enabled",
+    "is_up",
+    "optic",
+    "optic_serial",
+    "mac_address",
+    "ipv4_address",
+    "ipv6_address",
+    "isis_neighbor",
+    "isis_state",
+    "isis_nh",
+    "isis_metric",
+    "isis_ipv6",
+    "mpls_enabled",
+    "arp_nh",
+    "arp_nh_mac",
+    "nd_nh",
+    "nd_mac",
+    "local_as",
+    "remote_as",
+    "router_id",
+    "local_address",
+    "local_dns",
+    "remote_address",
+    "remote_dns",
+    "import_policy",
+    "export_policy",
+    "v4_received_prefix",
+    "v4_accepted_prefix",
+    "v4_advertised_prefix",
+    "v6_received_prefix",
+    "v6_accepted_prefix",
+    "v6_advertised_prefix",
+)
@@ -1,19 +1,36 @@
+import socket
+import time
+from functools import lru_cache
+
 import keyring
 import pyotp
 from atlassian import Jira
 from napalm.base import get_network_driver
 
 
+@lru_cache(maxsize=None)
+def _cred(service: str, username: str):
+    """Return keyring password, cached across Login instances."""
+    return keyring.get_password(service, username)
+
+
+@lru_cache(maxsize=256)
+def _resolve(hostname: str) -> str:
+    """Return IPv4 address for hostname, cached across connections."""
+    return socket.gethostbyname(hostname)
+
+
 class Login:
     def __init__(self):
         # credentials, via keyring
-        self.cas_user = keyring.get_password("cas", "user")
-        self.cas_pass = keyring.get_password("cas", self.cas_user)
-        self.jira_url = keyring.get_password("jira", "url")
+        self.cas_user = _cred("cas", "user")
+        self.cas_pass = _cred("cas", self.cas_user)
+        self.jira_url = _cred("jira", "url")
 
         self.mfa_user = self.cas_user + "mfa"
-        self.mfa_pass = keyring.get_password("mfa", self.mfa_user)
-        self.otp = pyotp.TOTP(keyring.get_password("otp", self.mfa_user))
+        self.mfa_pass = _cred("mfa", self.mfa_user)
+        self.otp = pyotp.TOTP(_cred("otp", self.mfa_user))
+        self._last_otp = None
 
     def jira_login(self):
         """Returns Jira object, uses CAS credentials."""
@@ -26,9 +43,22 @@ class Login:
     def napalm_connect(self, hostname, device_type):
         """Returns NAPALM object, uses MFA credentials."""
         driver = get_network_driver(device_type)
+        code = self.otp.now()
+        self._last_otp = (code, int(time.time() // self.otp.interval))
         return driver(
-            hostname=hostname,
+            hostname=_resolve(hostname),
             username=self.mfa_user,
-            password=self.mfa_pass + self.otp.now(),
+            password=self.mfa_pass + code,
             timeout=300,
         )
+
+    def wait_for_new_otp(self):
+        """Sleep until the next TOTP window if the last code is still current.
+        OTP codes cannot be reused, so a new connection needs a new window.
+        """
+        if self._last_otp is None:
+            return
+
+        window = int(time.time() // self.otp.interval)
+        if window == self._last_otp[1]:
+            time.sleep(self.otp.interval - (time.time() % self.otp.interval) + 1)
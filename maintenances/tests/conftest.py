@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# modules import each other relative to the package directory (i.e. 'from lib
+# import parsers'), as when run from within it
+sys.path.insert(0, str(Path(__file__).parents[1] / "maintenances"))
@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from custom_napalm import junos
+from custom_napalm.utils import junos_cust_views
+
+DATA = Path(__file__).parent / "data"
+
+
+def test_get_mpls_interfaces_custom(monkeypatch):
+    table = junos_cust_views.MPLSInterfaceTable
+    monkeypatch.setattr(
+        junos_cust_views,
+        "MPLSInterfaceTable",
+        lambda device: table(path=str(DATA / "mpls_interfaces.xml")),
+    )
+    driver = junos.CustomJunOSDriver.__new__(junos.CustomJunOSDriver)
+    driver.device = None
+
+    # keyed by full interface name
+    assert driver.get_mpls_interfaces_custom() == {
+        "ge-0/0/0.0": {"mpls_enabled": True},
+        "xe-0/1/0.0": {"mpls_enabled": False},
+    }
@@ -0,0 +1,85 @@
+from lib import parsers
+
+
+def test_format_ip_int():
+    data = {
+        "ge-0/0/0.0": {
+            "ipv4": {"192.0.2.1": {"prefix_length": 31}},
+            "ipv6": {"2001:db8::1": {"prefix_length": 127}},
+        },
+        "ge-0/0/1.0": {"ipv4": {"192.0.2.3": {"prefix_length": 31}}},
+    }
+    assert parsers.format_ip_int(data) == {
+        "ge-0/0/0.0": {
+            "ipv4_address": "192.0.2.1/31",
+            "ipv6_address": "2001:db8::1/127",
+        },
+        "ge-0/0/1.0": {"ipv4_address": "192.0.2.3/31"},
+    }
+
+
+def test_collapse_bgp_matches_v4_and_v6():
+    iface_dict = {
+        "ge-0/0/0.0": {"arp_nh": "192.0.2.0", "nd_nh": "2001:db8::"},
+        "ge-0/0/1.0": {"arp_nh": "192.0.2.2"},
+    }
+    bgp_dict = {
+        "192.0.2.0": {"v4_received_prefix": 10},
+        "2001:db8::": {"v6_received_prefix": 20},
+        "198.51.100.1": {"v4_received_prefix": 30},
+    }
+
+    interfaces, bgp_missing = parsers.collapse_bgp(iface_dict, bgp_dict)
+
+    assert interfaces["ge-0/0/0.0"] == {
+        "arp_nh": "192.0.2.0",
+        "nd_nh": "2001:db8::",
+        "v4_received_prefix": 10,
+        "v6_received_prefix": 20,
+    }
+    assert interfaces["ge-0/0/1.0"] == {"arp_nh": "192.0.2.2"}
+
+    # matched peers are popped, un-matched are returned
+    assert bgp_missing == {"198.51.100.1": {"v4_received_prefix": 30}}
+
+
+def test_format_bgp_detail(monkeypatch):
+    monkeypatch.setattr(
+        parsers, "dns_name", lambda ip: "local-rtr" if ip == "192.0.2.0" else None
+    )
+    data = {
+        "global": {
+            64512: [
+                {
+                    "up": True,
+                    "local_as": 2152,
+                    "remote_as": 64512,
+                    "router_id": "192.0.2.1",
+                    "local_address": "192.0.2.0",
+                    "remote_address": "192.0.2.1",
+                    "import_policy": "IN",
+                    "export_policy": "OUT",
+                    "received_prefix_count": 10,
+                    "accepted_prefix_count": 9,
+                    "advertised_prefix_count": 8,
+                }
+            ]
+        }
+    }
+    assert parsers.format_bgp_detail(data) == {
+        "192.0.2.1": {
+            "is_up": True,
+            "local_as": 2152,
+            "remote_as": 64512,
+            "router_id": "192.0.2.1",
+            "local_address": "192.0.2.0",
+            "local_dns": "local-rtr",
+            "remote_address": "192.0.2.1",
+            "remote_dns": "No A/AAAA Record",
+            "import_policy": "IN",
+            "export_policy": "OUT",
+            "v4_received_prefix": 10,
+            "v4_accepted_prefix": 9,
+            "v4_advertised_prefix": 8,
+        }
+    }